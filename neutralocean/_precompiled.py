@@ -0,0 +1,95 @@
+"""Ahead-of-time compilation of neutral trajectory functions
+
+The first call to `neutral_trajectory` or `ntp_bottle_to_cast` in a Python
+process pays several seconds for Numba to compile the root-finding, the
+interpolant, and the equation of state.  For many short jobs, this dominates.
+
+Running this module, as in
+
+    python -m neutralocean._precompiled
+
+builds an extension module, `neutralocean_core`, in the `neutralocean`
+package directory.  It holds compiled versions of `ntp_bottle_to_cast` and
+`neutral_trajectory` for a few common combinations of equation of state and
+interpolant.  When this extension module is present, `neutralocean.traj`
+uses it for calls that match one of these combinations, so no compilation
+happens at run time.  Other calls are compiled just-in-time, as usual.
+
+Notes
+-----
+This relies on `numba.pycc`, which requires a C compiler.  The extension must
+be rebuilt whenever neutralocean or Numba are updated.  It records the versions
+it was built with, and `neutralocean.traj` ignores it, with a warning, when
+these differ from the installed versions.
+"""
+
+import os
+
+import numba
+import numpy as np
+from numba.pycc import CC
+
+from neutralocean import __version__
+from neutralocean.eos.tools import make_eos_diff
+from neutralocean.ppinterp import select_ppc
+from neutralocean.lib import find_first_nan
+from neutralocean.traj import _ntp_bottle_to_cast, _neutral_trajectory_core
+
+# (eos, interp) pairs to compile.  Only non-Boussinesq forms are compiled.
+COMBOS = (("jmd95", "linear"), ("gsw", "linear"), ("jmd95", "pchip"))
+
+cc = CC("neutralocean_core")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+def _export(eos, interp):
+    eos_diff = make_eos_diff(eos)
+    ppc_fn = select_ppc(interp, "1")
+
+    @cc.export(
+        f"ntp_bottle_to_cast_{eos}_{interp}",
+        "UniTuple(f8, 3)(f8, f8, f8, f8[:], f8[:], f8[:], f8)",
+    )
+    def ntp_bottle_to_cast(sB, tB, pB, S, T, P, tol_p):
+        n_good = S.size
+        for k in range(S.size):
+            if np.isnan(S[k]):
+                n_good = k
+                break
+        if n_good < 2:
+            return np.nan, np.nan, np.nan
+        Sppc = ppc_fn(P, S)
+        Tppc = ppc_fn(P, T)
+        return _ntp_bottle_to_cast(
+            sB, tB, pB, Sppc, Tppc, P, n_good, tol_p, eos_diff
+        )
+
+    @cc.export(
+        f"neutral_trajectory_{eos}_{interp}",
+        "UniTuple(f8[:], 3)(f8[:, ::1], f8[:, ::1], f8[:, ::1], f8, f8)",
+    )
+    def neutral_trajectory(S, T, P, p0, tol_p):
+        n_good = find_first_nan(S)
+        return _neutral_trajectory_core(
+            S, T, P, n_good, p0, tol_p, eos_diff, ppc_fn
+        )
+
+
+def _export_versions(neutralocean_version, numba_version):
+    @cc.export("neutralocean_version", "unicode_type()")
+    def neutralocean_version_():
+        return neutralocean_version
+
+    @cc.export("numba_version", "unicode_type()")
+    def numba_version_():
+        return numba_version
+
+
+_export_versions(__version__, numba.__version__)
+
+for eos, interp in COMBOS:
+    _export(eos, interp)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -71,7 +71,7 @@ def bfs_conncomp1(indptr, indices, root, good):
 
 @nb.njit
 def bfs_conncomp1_wet(
-    indptr, indices, root, s, t, p, S, T, P, n_good, tol_p, eos, ppc_fn, p_ml
+    indptr, indices, root, s, t, p, S, T, P, n_good, tol_p, eos_diff, ppc_fn, p_ml
 ):
     """
     As in bfs_conncomp1 but extending the perimeter via wetting.
@@ -112,10 +112,12 @@ def bfs_conncomp1_wet(
         Error tolerance when root-finding to update the pressure or depth of
         the surface in each water column. Units are the same as `P`.
 
-    eos : function
+    eos_diff : function
 
-        The equation of state, giving the density or specific volume as a
-        function of `S`, `T`, and `P` inputs.
+        The difference of the equation of state, giving the density or
+        specific volume, between two parcels at the same pressure or depth, as
+        a function of `(s1, t1, s2, t2, p)` inputs.  Construct this as
+        `neutralocean.eos.make_eos_diff(eos)`.
 
         This should be @numba.njit decorated and need not be
         vectorized, as it will be called many times with scalar inputs.
@@ -206,7 +208,7 @@ def bfs_conncomp1_wet(
                         P[n],
                         n_good[n],
                         tol_p,
-                        eos,
+                        eos_diff,
                     )
 
                     if np.isfinite(p[n]) and p[n] > p_ml[n]:
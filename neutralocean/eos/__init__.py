@@ -1 +1 @@
-from .tools import make_eos, make_eos_s_t, make_eos_p, vectorize_eos
+from .tools import make_eos, make_eos_s_t, make_eos_p, make_eos_diff, vectorize_eos
@@ -12,6 +12,9 @@ specvol_s_t :: compute the partial derivatives of specific volume th
 specvol_p :: compute the partial derivative of specific volume with
     respect to pressure
 
+specvol_diff :: computes the specific volume difference between two parcels
+    at the same pressure
+
 Notes:
 To make Boussinesq versions of these functions, see 
 `neutralocean.eos.tools.make_eos_bsq`.
@@ -272,6 +275,35 @@ def specvol_p(SA, CT, p):
     return _p(x, y, z)
 
 
+@nb.njit
+def specvol_diff(SA1, CT1, SA2, CT2, p):
+    """
+    GSW specific volume difference between two parcels at the same pressure
+
+    The terms depending only on pressure are the same for both parcels, so
+    they cancel and are not evaluated.
+
+    Parameters
+    ----------
+    SA1, CT1 : float
+        Absolute Salinity [g/kg] and Conservative Temperature [deg C] of the
+        first parcel
+    SA2, CT2 : float
+        Absolute Salinity [g/kg] and Conservative Temperature [deg C] of the
+        second parcel
+    p : float
+        sea pressure (i.e. absolute pressure - 10.1325 dbar)  [dbar]
+
+    Returns
+    -------
+    specvol_diff : float
+        Specific volume of the first parcel minus that of the second [m3 kg-1]
+    """
+    (x1, y1, z, _) = _process(SA1, CT1, p)
+    (x2, y2, _, _) = _process(SA2, CT2, p)
+    return _specvol_anomaly(x1, y1, z) - _specvol_anomaly(x2, y2, z)
+
+
 @nb.njit
 def specvol_s_t_ss_st_tt_sp_tp(SA, CT, p):
     """
@@ -389,6 +421,34 @@ def _specvol(x, y, z):
     + z*    v006))))))
 
 
+@nb.njit
+def _specvol_anomaly(x, y, z):
+    # As _specvol, less the terms depending only on z
+    return (   x*(v100 + x*(v200 + x*(v300 + x*(v400 + x*(v500 + x*v600)))))
+       + y*(v010 + x*(v110 + x*(v210 + x*(v310 + x*(v410 + x*v510))))
+       + y*(v020 + x*(v120 + x*(v220 + x*(v320 + x*v420)))
+       + y*(v030 + x*(v130 + x*(v230 + x*v330))
+       + y*(v040 + x*(v140 + x* v240)
+       + y*(v050 + x* v150
+       + y* v060)))))
+    + z*(   x*(v101 + x*(v201 + x*(v301 + x*(v401 + x*v501))))
+       + y*(v011 + x*(v111 + x*(v211 + x*(v311 + x*v411)))
+       + y*(v021 + x*(v121 + x*(v221 + x*v321))
+       + y*(v031 + x*(v131 + x* v231)
+       + y*(v041 + x* v141
+       + y* v051))))
+    + z*(   x*(v102 + x*(v202 + x*(v302 + x*v402)))
+       + y*(v012 + x*(v112 + x*(v212 + x*v312))
+       + y*(v022 + x*(v122 + x* v222)
+       + y*(v032 + x* v132
+       + y* v042)))
+    + z*(   x*(v103 + x* v203)
+       + y*(v013 + x* v113
+       + y* v023)
+    + z*(   x* v104
+       + y* v014)))))
+
+
 @nb.njit
 def _s(x, y, z):
     return ( v100 + x*(2*v200 + x*(3*v300 + x*(4*v400 + x*(5*v500 + x*(6*v600)))))
@@ -12,6 +12,9 @@ rho_s_t :: compute the partial derivatives of in-situ density with
 rho_p :: compute the partial derivative of in-situ density with
     respect to pressure
 
+rho_diff :: computes the in-situ density difference between two parcels at
+    the same pressure
+
 Notes:
 To make Boussinesq versions of these functions, see 
 `neutralocean.eos.tools.make_eos_bsq`.
@@ -147,6 +150,51 @@ def rho(s, t, p):
     .. [1] Jackett and McDougall, 1995, JAOT 12[4], pp. 381-388
     """
 
+    rho0, K = _rho0_K(s, t, p)
+    return rho0 / (1.0 - p / K)
+
+
+@nb.njit
+def rho_diff(s1, t1, s2, t2, p):
+    """JMD95 [1]_ in-situ density difference between two parcels at the same pressure
+
+    Parameters
+    ----------
+    s1, t1 : float
+        Practical salinity [PSS-78] and potential temperature [IPTS-68] of
+        the first parcel
+    s2, t2 : float
+        Practical salinity [PSS-78] and potential temperature [IPTS-68] of
+        the second parcel
+    p : float
+        Pressure [dbar]
+
+    Returns
+    -------
+    rho_diff : float
+        JMD95 in-situ density of the first parcel minus that of the second
+        [kg m-3]
+
+    Notes
+    -----
+    Writing the density as `rho0 * K / (K - p)`, where `rho0` is the density
+    at zero pressure and `K` is the secant bulk modulus, the two densities
+    are put over a common denominator, so there is one division rather than
+    four.
+
+    .. [1] Jackett and McDougall, 1995, JAOT 12[4], pp. 381-388
+    """
+
+    rho01, K1 = _rho0_K(s1, t1, p)
+    rho02, K2 = _rho0_K(s2, t2, p)
+    Kp1 = K1 - p
+    Kp2 = K2 - p
+    return (rho01 * K1 * Kp2 - rho02 * K2 * Kp1) / (Kp1 * Kp2)
+
+
+@nb.njit
+def _rho0_K(s, t, p):
+    # The in-situ density at zero pressure, and the secant bulk modulus at p
     s1o2 = np.sqrt(s)
 
     # fmt: off
@@ -159,15 +207,15 @@ def rho(s, t, p):
         + p * (     2.102898e-05 + t*(-1.202016e-06 + t*  1.394680e-08)
         +   s *   (-2.040237e-07 + t*( 6.128773e-09 + t*  6.207323e-11)) )) )
 
-    # The in-situ density
-    rho = (
+    # The in-situ density at zero pressure
+    rho0 = (
                    999.842594   + t*( 6.793952e-02 + t*(-9.095290e-03 + t*( 1.001685e-04 + t*(-1.120083e-06 + t*6.536332e-09))))
         + s * (    8.244930e-01 + t*(-4.089900e-03 + t*( 7.643800e-05 + t*(-8.246700e-07 + t*  5.387500e-09)))
         + s1o2 * (-5.724660e-03 + t*( 1.022700e-04 + t* -1.654600e-06))
         + s    *   4.831400e-04
-        )) / (1.0 - p / K )
+        ))
     # fmt: on
-    return rho
+    return rho0, K
 
 
 # If we specified a signature for scalar inputs and outputs, such as
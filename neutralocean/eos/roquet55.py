@@ -0,0 +1,326 @@
+"""
+Density of Sea Water using the Roquet et al. (2015) [1]_ 55-term polynomial
+
+Functions:
+
+rho :: computes in-situ density from Absolute Salinity, Conservative
+    Temperature and pressure
+
+rho_s_t :: compute the partial derivatives of in-situ density with
+    respect to Absolute Salinity and Conservative Temperature
+
+rho_p :: compute the partial derivative of in-situ density with
+    respect to pressure
+
+rho_diff :: computes the difference in in-situ density between two
+    parcels at the same pressure
+
+Notes:
+To make Boussinesq versions of these functions, see
+`neutralocean.eos.tools.make_eos_bsq`.
+
+To make vectorized versions of these functions, see
+`neutralocean.eos.tools.vectorize_eos`.
+
+This is the 55-term polynomial for in-situ density, fit to TEOS-10 in the
+oceanographic funnel with errors comparable to those of TEOS-10 itself [1]_.
+It is cheaper to evaluate than the 75-term polynomial for specific volume
+in `.gsw`.  The density is written as the sum of a reference profile
+`r0(p)`, depending on pressure only, and an anomaly depending on Absolute
+Salinity, Conservative Temperature, and pressure.  The reference profile
+cancels when differencing the density of two parcels at the same pressure,
+as in `rho_diff`.
+
+The coefficients are as in polyTEOS10_bsq of Fabien Roquet's polyTEOS
+package, which is also used in NEMO and MOM6.
+
+.. [1] Roquet, F., Madec, G., McDougall, T.J., Barker, P.M., 2015: Accurate
+   polynomial expressions for the density and specific volume of seawater
+   using the TEOS-10 standard. Ocean Modelling, 90, pp. 29-43.
+"""
+
+# Check value computed on 15/10/2026, and agrees with polyTEOS10_bsq in
+# polyTEOS and with MOM_EOS_Roquet_rho.F90 in MOM6.
+#
+# roquet55.rho(35.0, 15.0, 0.0)
+# 1025.8476941561225
+# roquet55.rho(38.0, 15.0, 6000.0)
+# 1052.7759428106908
+
+import numpy as np
+import numba as nb
+
+# Reduced variables are
+# ss = sqrt((SA + deltaS) / SAu),  tt = CT / CTu,  pp = p / Zu
+SAu = 40.0 * 35.16504 / 35.0
+CTu = 40.0
+Zu = 1e4
+deltaS = 32.0
+
+# fmt: off
+# Coefficients of the reference profile r0(pp)
+R00 =  4.6494977072e+01
+R01 = -5.2099962525e+00
+R02 =  2.2601900708e-01
+R03 =  6.4326772569e-02
+R04 =  1.5616995503e-02
+R05 = -1.7243708991e-03
+
+# Coefficients of the density anomaly, R_ijk multiplying ss^i tt^j pp^k
+R000 =  8.0189615746e+02
+R100 =  8.6672408165e+02
+R200 = -1.7864682637e+03
+R300 =  2.0375295546e+03
+R400 = -1.2849161071e+03
+R500 =  4.3227585684e+02
+R600 = -6.0579916612e+01
+R010 =  2.6010145068e+01
+R110 = -6.5281885265e+01
+R210 =  8.1770425108e+01
+R310 = -5.6888046321e+01
+R410 =  1.7681814114e+01
+R510 = -1.9193502195e+00
+R020 = -3.7074170417e+01
+R120 =  6.1548258127e+01
+R220 = -6.0362551501e+01
+R320 =  2.9130021253e+01
+R420 = -5.4723692739e+00
+R030 =  2.1661789529e+01
+R130 = -3.3449108469e+01
+R230 =  1.9717078466e+01
+R330 = -3.1742946532e+00
+R040 = -8.3627885467e+00
+R140 =  1.1311538584e+01
+R240 = -5.3563304045e+00
+R050 =  5.4048723791e-01
+R150 =  4.8169980163e-01
+R060 = -1.9083568888e-01
+R001 =  1.9681925209e+01
+R101 = -4.2549998214e+01
+R201 =  5.0774768218e+01
+R301 = -3.0938076334e+01
+R401 =  6.6051753097e+00
+R011 = -1.3336301113e+01
+R111 = -4.4870114575e+00
+R211 =  5.0042598061e+00
+R311 = -6.5399043664e-01
+R021 =  6.7080479603e+00
+R121 =  3.5063081279e+00
+R221 = -1.8795372996e+00
+R031 = -2.4649669534e+00
+R131 = -5.5077101279e-01
+R041 =  5.5927935970e-01
+R002 =  2.0660924175e+00
+R102 = -4.9527603989e+00
+R202 =  2.5019633244e+00
+R012 =  2.0564311499e+00
+R112 = -2.1311365518e-01
+R022 = -1.2419983026e+00
+R003 = -2.3342758797e-02
+R103 = -1.8507636718e-02
+R013 =  3.7969820455e-01
+# fmt: on
+
+
+# If ndarray inputs are needed, it is best to use @nb.vectorize.  That is,
+# apply `.tools.vectorize_eos`.  A vectorized function specified
+# for scalars is about twice as fast as a signatureless njit'ed function
+# applied to ndarrays.
+@nb.njit
+def rho(SA, CT, p):
+    """
+    Roquet et al. (2015) 55-term polynomial for in-situ density.
+
+    Parameters
+    ----------
+    SA : float
+        Absolute Salinity [g/kg]
+    CT : float
+        Conservative Temperature [deg C]
+    p : float
+        sea pressure (i.e. absolute pressure - 10.1325 dbar)  [dbar]
+
+    Returns
+    -------
+    rho : float
+        In-situ density [kg m-3]
+    """
+    (ss, tt, pp) = _process(SA, CT, p)
+    return _r0(pp) + _anomaly(ss, tt, pp)
+
+
+@nb.njit
+def rho_s_t(SA, CT, p):
+    """
+    Partial derivatives of in-situ density with respect to salinity & temperature
+
+    Parameters
+    ----------
+    SA : float
+        Absolute Salinity [g/kg]
+    CT : float
+        Conservative Temperature [deg C]
+    p : float
+        sea pressure (i.e. absolute pressure - 10.1325 dbar)  [dbar]
+
+    Returns
+    -------
+    s : float
+        Partial deriv of in-situ density w.r.t. SA [kg m-3 / (g/kg)]
+
+    t : float
+        Partial deriv of in-situ density w.r.t. CT [kg m-3 / (deg C)]
+    """
+    (ss, tt, pp) = _process(SA, CT, p)
+    s = _s(ss, tt, pp) * (0.5 / (SAu * ss))  # chain rule, d(ss)/d(SA)
+    t = _t(ss, tt, pp) * (1.0 / CTu)
+    return (s, t)
+
+
+@nb.njit
+def rho_p(SA, CT, p):
+    """
+    Partial derivative of in-situ density with respect to pressure
+
+    Parameters
+    ----------
+    SA : float
+        Absolute Salinity [g/kg]
+    CT : float
+        Conservative Temperature [deg C]
+    p : float
+        sea pressure (i.e. absolute pressure - 10.1325 dbar)  [dbar]
+
+    Returns
+    -------
+    p : float
+        Partial deriv of in-situ density w.r.t. p [kg m-3 / (dbar)]
+    """
+    (ss, tt, pp) = _process(SA, CT, p)
+    return (_r0_p(pp) + _p(ss, tt, pp)) * (1.0 / Zu)
+
+
+@nb.njit
+def rho_diff(SA1, CT1, SA2, CT2, p):
+    """
+    Difference in in-situ density between two parcels at the same pressure
+
+    This equals `rho(SA1, CT1, p) - rho(SA2, CT2, p)`, but the reference
+    profile, depending only on `p`, cancels and is not evaluated.
+
+    Parameters
+    ----------
+    SA1, CT1 : float
+        Absolute Salinity [g/kg] and Conservative Temperature [deg C] of the
+        first parcel
+    SA2, CT2 : float
+        Absolute Salinity [g/kg] and Conservative Temperature [deg C] of the
+        second parcel
+    p : float
+        sea pressure (i.e. absolute pressure - 10.1325 dbar)  [dbar]
+
+    Returns
+    -------
+    rho_diff : float
+        In-situ density of the first parcel minus that of the second [kg m-3]
+    """
+    pp = p * (1.0 / Zu)
+    ss1 = np.sqrt((SA1 + deltaS) * (1.0 / SAu))
+    ss2 = np.sqrt((SA2 + deltaS) * (1.0 / SAu))
+    return _anomaly(ss1, CT1 * (1.0 / CTu), pp) - _anomaly(
+        ss2, CT2 * (1.0 / CTu), pp
+    )
+
+
+@nb.njit
+def _process(SA, CT, p):
+    ss = np.sqrt((SA + deltaS) * (1.0 / SAu))
+    tt = CT * (1.0 / CTu)
+    pp = p * (1.0 / Zu)
+    return (ss, tt, pp)
+
+
+""" Begin individual polynomials, in terms of the reduced variables """
+
+# fmt: off
+@nb.njit
+def _r0(pp):
+    return pp*(R00 + pp*(R01 + pp*(R02 + pp*(R03 + pp*(R04 + pp*R05)))))
+
+
+@nb.njit
+def _r0_p(pp):
+    return R00 + pp*(2.0*R01 + pp*(3.0*R02 + pp*(4.0*R03 + pp*(5.0*R04 + pp*6.0*R05))))
+
+
+@nb.njit
+def _anomaly(ss, tt, pp):
+    return (R000 + ss*(R100 + ss*(R200 + ss*(R300 + ss*(R400 + ss*(R500 + ss*R600)))))
+       + tt*(R010 + ss*(R110 + ss*(R210 + ss*(R310 + ss*(R410 + ss*R510))))
+       + tt*(R020 + ss*(R120 + ss*(R220 + ss*(R320 + ss*R420)))
+       + tt*(R030 + ss*(R130 + ss*(R230 + ss*R330))
+       + tt*(R040 + ss*(R140 + ss* R240)
+       + tt*(R050 + ss* R150
+       + tt* R060)))))
+    + pp*(  R001 + ss*(R101 + ss*(R201 + ss*(R301 + ss*R401)))
+       + tt*(R011 + ss*(R111 + ss*(R211 + ss*R311))
+       + tt*(R021 + ss*(R121 + ss* R221)
+       + tt*(R031 + ss* R131
+       + tt* R041)))
+    + pp*(  R002 + ss*(R102 + ss* R202)
+       + tt*(R012 + ss* R112
+       + tt* R022)
+    + pp*(  R003 + ss* R103
+       + tt* R013))))
+
+
+@nb.njit
+def _s(ss, tt, pp):
+    # Partial derivative of _anomaly w.r.t. ss
+    return (R100 + ss*(2.0*R200 + ss*(3.0*R300 + ss*(4.0*R400 + ss*(5.0*R500 + ss*6.0*R600))))
+       + tt*(R110 + ss*(2.0*R210 + ss*(3.0*R310 + ss*(4.0*R410 + ss*5.0*R510)))
+       + tt*(R120 + ss*(2.0*R220 + ss*(3.0*R320 + ss*4.0*R420))
+       + tt*(R130 + ss*(2.0*R230 + ss*3.0*R330)
+       + tt*(R140 + ss*2.0*R240
+       + tt* R150))))
+    + pp*(  R101 + ss*(2.0*R201 + ss*(3.0*R301 + ss*4.0*R401))
+       + tt*(R111 + ss*(2.0*R211 + ss*3.0*R311)
+       + tt*(R121 + ss*2.0*R221
+       + tt* R131))
+    + pp*(  R102 + ss*2.0*R202
+       + tt* R112
+    + pp*   R103)))
+
+
+@nb.njit
+def _t(ss, tt, pp):
+    # Partial derivative of _anomaly w.r.t. tt
+    return (R010 + ss*(R110 + ss*(R210 + ss*(R310 + ss*(R410 + ss*R510))))
+       + tt*(2.0*R020 + ss*(2.0*R120 + ss*(2.0*R220 + ss*(2.0*R320 + ss*2.0*R420)))
+       + tt*(3.0*R030 + ss*(3.0*R130 + ss*(3.0*R230 + ss*3.0*R330))
+       + tt*(4.0*R040 + ss*(4.0*R140 + ss*4.0*R240)
+       + tt*(5.0*R050 + ss*5.0*R150
+       + tt* 6.0*R060))))
+    + pp*(  R011 + ss*(R111 + ss*(R211 + ss*R311))
+       + tt*(2.0*R021 + ss*(2.0*R121 + ss*2.0*R221)
+       + tt*(3.0*R031 + ss*3.0*R131
+       + tt* 4.0*R041))
+    + pp*(  R012 + ss*R112
+       + tt* 2.0*R022
+    + pp*   R013)))
+
+
+@nb.njit
+def _p(ss, tt, pp):
+    # Partial derivative of _anomaly w.r.t. pp
+    return (R001 + ss*(R101 + ss*(R201 + ss*(R301 + ss*R401)))
+       + tt*(R011 + ss*(R111 + ss*(R211 + ss*R311))
+       + tt*(R021 + ss*(R121 + ss* R221)
+       + tt*(R031 + ss* R131
+       + tt* R041)))
+    + pp*(  2.0*(R002 + ss*(R102 + ss* R202)
+       + tt*(R012 + ss* R112
+       + tt* R022))
+    + pp*   3.0*(R003 + ss* R103
+       + tt* R013)))
+# fmt: on
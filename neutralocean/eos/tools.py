@@ -4,16 +4,25 @@ import numba as nb
 
 # List of modules in the same directory as this file, each of which must have
 # the following numba.njit'ed functions:  rho, rho_s_t, rho_p.
-modules = {"gsw": "specvol", "jmd95": "rho", "jmdfwg06": "rho"}
+# Modules may also have rho_diff; see `make_eos_diff`.
+# (Replace "rho" by the value in this dict, e.g. "specvol" for "gsw".)
+modules = {"gsw": "specvol", "jmd95": "rho", "jmdfwg06": "rho", "roquet55": "rho"}
 
 
+def _import_eos(eos, fcn_name):
+    # Import function `fcn_name` from module `eos` in this subpackage
+    return __import__(eos, globals(), locals(), [fcn_name], 1).__getattribute__(
+        fcn_name
+    )
+
+
+# Cached, so that repeated calls (e.g. from `ntp_bottle_to_cast` in a loop)
+# return the same function without re-importing or re-wrapping it.
+@ft.lru_cache(maxsize=10)
 def _make_eos(eos, derivs, num_p_derivs=0, grav=None, rho_c=None):
     if isinstance(eos, str):
         if eos in modules:
-            fcn_name = modules[eos] + derivs
-            fn = __import__(
-                "." + eos, globals(), locals(), [fcn_name], 1
-            ).__getattribute__(fcn_name)
+            fn = _import_eos(eos, modules[eos] + derivs)
         else:
             raise ValueError(
                 f"Equation of state {eos} not (yet) implemented."
@@ -43,8 +52,10 @@ def make_eos(eos, grav=None, rho_c=None):
 
         If a str, can be 'gsw' to generate the TEOS-10 specific volume [1]_,
         'jmd95' to generate the Jackett and McDougall (1995) in-situ
-        density [2]_, or 'jmdfwg06' to generate the Jackett et al (2006)
-        in-situ density [3]_.
+        density [2]_, 'jmdfwg06' to generate the Jackett et al (2006)
+        in-situ density [3]_, or 'roquet55' to generate the Roquet et al
+        (2015) 55-term polynomial approximation of the TEOS-10 in-situ
+        density [4]_.
 
         If a function, should be an equation of state as a function of
         practical / Absolute salinity, potential / Conservative temperature,
@@ -77,6 +88,10 @@ def make_eos(eos, grav=None, rho_c=None):
        Conservative Temperature, and the Freezing Temperature of Seawater.
        Journal of Atmospheric and Oceanic Technology, 23(12), 1709–1728.
        https://doi.org/10.1175/JTECH1946.1
+
+    .. [4] Roquet, F., Madec, G., McDougall, T.J., Barker, P.M., 2015: Accurate
+       polynomial expressions for the density and specific volume of seawater
+       using the TEOS-10 standard. Ocean Modelling, 90, pp. 29-43.
     """
 
     return _make_eos(eos, "", 0, grav, rho_c)
@@ -122,6 +137,74 @@ def make_eos_p(eos, grav=None, rho_c=None):
     return _make_eos(eos, "_p", 1, grav, rho_c)
 
 
+def make_eos_diff(eos, grav=None, rho_c=None):
+    """Make a function for the difference of an equation of state between two
+    parcels at the same pressure
+
+    Parameters
+    ----------
+    eos, grav, rho_c :
+        See `make_eos`
+
+    Returns
+    -------
+    eos_diff : function
+
+        Function of `(s1, t1, s2, t2, p)` returning
+        `eos(s1, t1, p) - eos(s2, t2, p)`.
+        If `eos` is a str naming an equation of state that provides a fused
+        implementation of this difference (e.g. 'roquet55' or 'gsw', in which
+        terms depending only on pressure cancel), that is used.  Otherwise, this
+        simply evaluates the equation of state twice.
+    """
+
+    return _make_eos_diff(eos, grav, rho_c)
+
+
+@ft.lru_cache(maxsize=10)
+def _make_eos_diff(eos, grav, rho_c):
+    if isinstance(eos, str) and eos in modules:
+        try:
+            fn = _import_eos(eos, modules[eos] + "_diff")
+        except AttributeError:
+            pass  # No fused implementation; fall back to the generic one below
+        else:
+            if grav != None and rho_c != None:
+                fn = make_bsq_diff(fn, grav, rho_c)
+            return fn
+
+    return _make_diff(make_eos(eos, grav, rho_c))
+
+
+@ft.lru_cache(maxsize=10)
+def _make_diff(eos):
+    # Build a function for the difference of `eos` between two parcels at
+    # the same pressure, by evaluating `eos` twice.
+    @nb.njit
+    def eos_diff(s1, t1, s2, t2, p):
+        return eos(s1, t1, p) - eos(s2, t2, p)
+
+    return eos_diff
+
+
+@ft.lru_cache(maxsize=10)
+def make_bsq_diff(fn, grav, rho_c):
+    """Make a Boussinesq version of a given equation of state difference
+
+    As `make_bsq`, but for functions of `(s1, t1, s2, t2, p)`, such as those
+    returned by `make_eos_diff`.
+    """
+
+    # Hydrostatic conversion from depth [m] to pressure [dbar]
+    z_to_p = 1e-4 * grav * rho_c
+
+    @nb.njit
+    def fn_bsq(s1, t1, s2, t2, z):
+        return fn(s1, t1, s2, t2, z * z_to_p)
+
+    return fn_bsq
+
+
 @ft.lru_cache(maxsize=10)
 def make_bsq(fn, grav, rho_c, num_p_derivs=0):
     """Make a Boussinesq version of a given equation of state (or its partial derivative(s))
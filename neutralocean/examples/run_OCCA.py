@@ -215,7 +215,7 @@ from neutralocean.label import veronis_density
 from neutralocean.lib import _process_casts, find_first_nan
 from neutralocean.interp1d import make_interpolator
 from neutralocean.ppinterp import select_ppc
-from neutralocean.eos import make_eos_p, vectorize_eos
+from neutralocean.eos import make_eos_p, make_eos_diff, vectorize_eos
 from neutralocean.traj import ntp_bottle_to_cast, _ntp_bottle_to_cast
 
 # In[Show vertical interpolation]
@@ -298,8 +298,9 @@ s1, t1, z1 = ntp_bottle_to_cast(sB, tB, zB, S1, T1, Z)
 n_good = find_first_nan(S1)[()]
 ppc_fn = select_ppc("linear", "1")
 S1ppc, T1ppc = (ppc_fn(Z, C) for C in (S1, T1))
+eos_diff = make_eos_diff(eos)
 s1, t1, z1 = _ntp_bottle_to_cast(
-    sB, tB, zB, S1ppc, T1ppc, Z, n_good, 1e-4, eos
+    sB, tB, zB, S1ppc, T1ppc, Z, n_good, 1e-4, eos_diff
 )
 
 
@@ -9,6 +9,16 @@ import numpy as np
 eps = np.finfo(np.float64).eps
 
 
+def select_zero(method="brent"):
+    """Select function for bracketed root-finding."""
+    if method == "brent":
+        return brent
+    elif method == "aps":
+        return aps
+    else:
+        raise ValueError(f"Expected `method` in ('brent', 'aps'); got {method}")
+
+
 @numba.njit
 def brent_guess(f, x, A, B, t, args=()):
     """
@@ -40,7 +50,7 @@ def brent_guess(f, x, A, B, t, args=()):
 
 
 @numba.njit
-def brent(f, a, b, t, args=()):
+def brent(f, a, b, t, args=(), ftol=0.0):
     """
     Find a zero of a univariate function within a given range
 
@@ -58,6 +68,10 @@ def brent(f, a, b, t, args=()):
     args : tuple
         Additional arguments, beyond the optimization argument, to be passed to f.
         Pass () when f is univariate.
+    ftol : float, Default 0.0
+        Tolerance on the value of f.  Convergence is also declared, returning
+        x, as soon as |f(x)| <= ftol.  With the default, 0, convergence is
+        determined only by `t`, except when f(x) is exactly 0.
 
     Returns
     -------
@@ -97,50 +111,47 @@ def brent(f, a, b, t, args=()):
         tol = 2.0 * eps * abs(b) + t
         m = 0.5 * (c - b)
 
-        if abs(m) <= tol or fb == 0.0:
+        if abs(m) <= tol or abs(fb) <= ftol:
             break
 
-        if abs(e) < tol or abs(fa) <= abs(fb):
-            e = m
-            d = e
-        else:
-            s = fb / fa
-            if a == c:
-                p = 2.0 * m * s
-                q = 1.0 - s
-            else:
-                q = fa / fc
-                r = fb / fc
-                p = s * (2.0 * m * q * (q - r) - (b - a) * (r - 1.0))
-                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
-
-            if 0.0 < p:
-                q = -q
-            else:
-                p = -p
-
-            s = e
-            e = d
-
-            if 2.0 * p < 3.0 * m * q - abs(tol * q) and p < abs(0.5 * s * q):
-                d = p / q
-            else:
-                e = m
-                d = e
+        # Choose between bisection and interpolation.  Both candidate steps
+        # are computed unconditionally and then selected using scalar
+        # ternaries and non-short-circuiting boolean operators (which compile
+        # to conditional moves), rather than by nested, hard-to-predict
+        # branches.
+        bisect = (abs(e) < tol) | (abs(fa) <= abs(fb))
+
+        # Secant step (when a == c) or inverse quadratic interpolation step.
+        # When bisecting, fa may be 0; guard the division as the result is
+        # unused in that case.  Also, |fc| >= |fb| > 0 here, so fc != 0.
+        s = fb / fa if fa != 0.0 else 0.0
+        q = fa / fc
+        r = fb / fc
+        secant = a == c
+        p = 2.0 * m * s if secant else s * (2.0 * m * q * (q - r) - (b - a) * (r - 1.0))
+        q = 1.0 - s if secant else (q - 1.0) * (r - 1.0) * (s - 1.0)
+
+        q = -q if 0.0 < p else q
+        p = abs(p)
+
+        # Accept the interpolation step only if it falls well within the
+        # bracket and shrinks faster than the step before last.
+        accept = (
+            (not bisect)
+            & (2.0 * p < 3.0 * m * q - abs(tol * q))
+            & (p < abs(0.5 * e * q))
+        )
+        e = d if accept else m
+        d = p / q if accept else m
 
         a = b
         fa = fb
 
-        if tol < abs(d):
-            b += d
-        elif 0.0 < m:
-            b += tol
-        else:
-            b -= tol
+        b += d if tol < abs(d) else (tol if 0.0 < m else -tol)
 
         fb = f(b, *args)
 
-        if (0.0 < fb and 0.0 < fc) or (fb <= 0.0 and fc <= 0.0):
+        if (0.0 < fb) == (0.0 < fc):
             c = a
             fc = fa
             e = b - a
@@ -150,7 +161,196 @@ def brent(f, a, b, t, args=()):
 
 
 @numba.njit
-def guess_to_bounds(f, x, A, B, args=()):
+def aps(f, a, b, t, args=(), ftol=0.0):
+    """
+    Find a zero of a univariate function within a given range
+
+    As `brent`, but using Algorithm 4.2 of Alefeld, Potra, and Shi (1995) [1]_.
+    This alternates inverse cubic interpolation and Newton-quadratic steps
+    with a double-length secant step, falling back on bisection when the range
+    fails to halve.  Its asymptotic order of convergence is higher than that of
+    `brent`, but with loose tolerances, few iterations are needed and the
+    number of evaluations of `f` is similar.
+
+    Parameters
+    ----------
+    f, a, b, t, args, ftol :
+        See brent
+
+    Returns
+    -------
+    float
+        Value of x where f(x) ~ 0.
+
+    Notes
+    -----
+    f should be a @numba.njit'ed function (when this function is njit'ed).
+
+    .. [1] Alefeld, Potra, and Shi, 1995. Algorithm 748: Enclosing Zeros of
+       Continuous Functions.  ACM Trans. Math. Softw. 21(3), pp. 327-344.
+    """
+
+    # Protection against bad input search range
+    if np.isnan(a) or np.isnan(b) or a > b:
+        return np.nan
+
+    fa = f(a, *args)
+    fb = f(b, *args)
+
+    # Protection against input range that doesn't have a sign change
+    if fa * fb > 0:
+        return np.nan
+
+    if abs(fa) <= ftol:
+        return a
+    if abs(fb) <= ftol:
+        return b
+
+    # The first step has only two points, so use the secant method.
+    tol = 2.0 * eps * abs(0.5 * (a + b)) + t
+    c = _aps_safeguard(a, b, a - fa * (b - a) / (fb - fa), tol)
+    fc = f(c, *args)
+    if abs(fc) <= ftol:
+        return c
+    a, b, fa, fb, d, fd = _aps_bracket(a, b, fa, fb, c, fc)
+    e = fe = np.nan
+
+    while True:
+        tol = 2.0 * eps * abs(0.5 * (a + b)) + t
+        if b - a <= 2.0 * tol:
+            break
+
+        w = b - a  # Width of the range at the start of this iteration
+
+        # Two interpolation steps, using the two points most recently removed
+        # from the range, d and e, as well as a and b.
+        for k in range(2, 4):
+            c = np.nan
+            if _aps_distinct(fa, fb, fd, fe):
+                c = _aps_ipzero(a, b, d, e, fa, fb, fd, fe)
+            if not a < c < b:  # also catches c = nan
+                c = _aps_newton_quadratic(a, b, d, fa, fb, fd, k)
+            c = _aps_safeguard(a, b, c, tol)
+            fc = f(c, *args)
+            if abs(fc) <= ftol:
+                return c
+            e, fe = d, fd
+            a, b, fa, fb, d, fd = _aps_bracket(a, b, fa, fb, c, fc)
+            if b - a <= 2.0 * tol:
+                break
+
+        if b - a <= 2.0 * tol:
+            break
+
+        # Double-length secant step from u, the end with the smaller |f|.
+        if abs(fa) < abs(fb):
+            u, fu = a, fa
+        else:
+            u, fu = b, fb
+        c = u - 2.0 * fu * (b - a) / (fb - fa)
+        if abs(c - u) > 0.5 * (b - a):
+            c = 0.5 * (a + b)
+        c = _aps_safeguard(a, b, c, tol)
+        fc = f(c, *args)
+        if abs(fc) <= ftol:
+            return c
+        e, fe = d, fd
+        a, b, fa, fb, d, fd = _aps_bracket(a, b, fa, fb, c, fc)
+        if b - a <= 2.0 * tol:
+            break
+
+        # If the range did not shrink enough, bisect.
+        if b - a > 0.5 * w:
+            e, fe = d, fd
+            c = 0.5 * (a + b)
+            fc = f(c, *args)
+            if abs(fc) <= ftol:
+                return c
+            a, b, fa, fb, d, fd = _aps_bracket(a, b, fa, fb, c, fc)
+
+    # Return the end of the range with the smaller |f|
+    return a if abs(fa) < abs(fb) else b
+
+
+@numba.njit
+def _aps_safeguard(a, b, c, tol):
+    # Move c, a trial point for [a, b], to be at least tol from a and b, or to
+    # the midpoint if [a, b] is narrower than 4 * tol.  This keeps c distinct
+    # from a and b, and ensures that when the zero is within tol of a or b,
+    # the range shrinks to meet the tolerance on the next step.
+    if not a < c < b or b - a < 4.0 * tol:  # also catches c = nan
+        return 0.5 * (a + b)
+    if c < a + tol:
+        return a + tol
+    if c > b - tol:
+        return b - tol
+    return c
+
+
+@numba.njit
+def _aps_bracket(a, b, fa, fb, c, fc):
+    # Shrink the range [a, b] to [a, c] or [c, b], maintaining the sign
+    # change.  Also return the removed end point, and its function value.
+    if (0.0 < fa) == (0.0 < fc):
+        return c, b, fc, fb, a, fa
+    else:
+        return a, c, fa, fc, b, fb
+
+
+@numba.njit
+def _aps_distinct(fa, fb, fd, fe):
+    # True if the four function values are finite and not too close together,
+    # so that inverse cubic interpolation is well conditioned.
+    if not np.isfinite(fd + fe):
+        return False
+    tiny = 32.0 * eps
+    return (
+        abs(fa - fb) > tiny
+        and abs(fa - fd) > tiny
+        and abs(fa - fe) > tiny
+        and abs(fb - fd) > tiny
+        and abs(fb - fe) > tiny
+        and abs(fd - fe) > tiny
+    )
+
+
+@numba.njit
+def _aps_ipzero(a, b, d, e, fa, fb, fd, fe):
+    # Zero of the cubic, in terms of f, interpolating x at the four points.
+    q11 = (d - e) * fd / (fe - fd)
+    q21 = (b - d) * fb / (fd - fb)
+    q31 = (a - b) * fa / (fb - fa)
+    d21 = (b - d) * fd / (fd - fb)
+    d31 = (a - b) * fb / (fb - fa)
+    q22 = (d21 - q11) * fb / (fe - fb)
+    q32 = (d31 - q21) * fa / (fd - fa)
+    d32 = (d31 - q21) * fd / (fd - fa)
+    q33 = (d32 - q22) * fa / (fe - fa)
+    return a + q31 + q32 + q33
+
+
+@numba.njit
+def _aps_newton_quadratic(a, b, d, fa, fb, fd, k):
+    # Take k Newton steps toward the zero of the quadratic interpolating f at
+    # a, b, and d.
+    B = (fb - fa) / (b - a)
+    A = ((fd - fb) / (d - b) - B) / (d - a)
+    if A == 0.0:
+        return a - fa / B
+    r = a if (0.0 < A) == (0.0 < fa) else b
+    for _ in range(k):
+        dp = B + A * (2.0 * r - a - b)  # derivative of the quadratic at r
+        if dp == 0.0:
+            return a - fa / B
+        r1 = r - ((A * (r - b) + B) * (r - a) + fa) / dp
+        if not a < r1 < b:
+            return r if a < r < b else 0.5 * (a + b)
+        r = r1
+    return r
+
+
+@numba.njit
+def guess_to_bounds(f, x, A, B, args=(), dx_init=0.0):
     """
     Search for a range containing a sign change, expanding geometrically
     outwards from the initial guess.
@@ -169,6 +369,12 @@ def guess_to_bounds(f, x, A, B, args=()):
     args : tuple
         Additional arguments beyond the optimization argument.
         Pass () when f is univariate.
+    dx_init : float, Default 0.0
+        Initial distance to expand outward from `x`.  If a root is expected
+        near `x` (e.g. from a previous, similar problem), pass a small
+        positive value here so that the search begins with a narrow range.
+        If 0, the initial distance is 1/50th of the distance from `x` to `A`
+        or `B`.
 
     Returns
     -------
@@ -190,13 +396,18 @@ def guess_to_bounds(f, x, A, B, args=()):
     x = min(max(x, A), B)
 
     # initial distance to expand outward from x, in positive and negative directions
-    dxp = (B - x) / 50
-    dxm = (x - A) / 50
+    if dx_init > 0.0:
+        dxp = min(dx_init, B - x)
+        dxm = min(dx_init, x - A)
+    else:
+        dxp = (B - x) / 50
+        dxm = (x - A) / 50
 
     # Set a = x, except when x is so close to A that machine roundoff makes dxm identically 0
     # which would lead to an infinite loop below.  In this case, set a = A.
     if dxm == 0:
         a = A
+        fapos = fa > 0.0
     else:
         a = x
         fapos = f(a, *args) > 0.0
@@ -204,6 +415,7 @@ def guess_to_bounds(f, x, A, B, args=()):
     # Similarly, set b = x, except for machine precision problems.
     if dxp == 0:
         b = B
+        fbpos = fb > 0.0
     else:
         b = x
         if dxm == 0.0:
@@ -26,16 +26,45 @@ def find_first_nan(a):
         Otherwise, `K = k[i,j]` is the smallest int such that `a[i,j,K-1]`
         is not NaN, but `a[i,j,K]` is NaN.
     """
-    nk = a.shape[-1]
-    k = np.full(a.shape[:-1], nk, dtype=np.int64)
+    k = np.empty(a.shape[:-1], dtype=np.int64)
     for n in np.ndindex(a.shape[0:-1]):
-        for i in range(nk):
-            if np.isnan(a[n][i]):
-                k[n] = i
-                break
+        k[n] = _find_first_nan_1d(a[n])
     return k
 
 
+@nb.njit(parallel=True)
+def find_first_nan_2d(a):
+    """The index to the first NaN along the last axis of a 2D array
+
+    As `find_first_nan`, but specialized to 2D input `a`, with the rows of
+    `a` processed in parallel.
+
+    Parameters
+    ----------
+    a : ndarray
+        2D input array possibly containing some NaN elements
+
+    Returns
+    -------
+    k : ndarray of int
+        1D array, where `k[i]` is the index to the first NaN in `a[i,:]`,
+        or `a.shape[1]` if `a[i,:]` has no NaN's.
+    """
+    k = np.empty(a.shape[0], dtype=np.int64)
+    for c in nb.prange(a.shape[0]):
+        k[c] = _find_first_nan_1d(a[c])
+    return k
+
+
+@nb.njit
+def _find_first_nan_1d(a):
+    # The index to the first NaN in 1D array `a`, or `len(a)` if none.
+    for i in range(a.size):
+        if np.isnan(a[i]):
+            return i
+    return a.size
+
+
 @nb.njit
 def take_fill(a, idx, fillval=np.nan):
     """
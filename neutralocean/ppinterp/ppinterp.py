@@ -173,6 +173,48 @@ def ppval1_two(x, X, Yppc, Zppc, d=0):
     return ppval_i(dx, Yppc, i, d), ppval_i(dx, Zppc, i, d)
 
 
+@nb.njit
+def _searchsorted_hint(x, X, i):
+    """
+    Find the interval of `X` containing `x`, checking near a hint first.
+
+    Returns `max(0, np.searchsorted(X, x) - 1)`, as in `ppval1`, assuming
+    `X[0] <= x <= X[-1]`.  The interval `i` and its two neighbours are checked
+    first, before falling back on a binary search.  When evaluating at a
+    sequence of nearby sites, such as the iterates of a root-finding
+    algorithm, passing the previous result as `i` avoids most binary searches.
+    """
+    n = len(X)
+    if 0 <= i <= n - 2:
+        if x <= X[i + 1]:
+            if i == 0 or X[i] < x:
+                return i
+            # x <= X[i], so check the interval to the left
+            if i == 1 or X[i - 1] < x:
+                return i - 1
+        elif i + 2 < n and x <= X[i + 2]:
+            # X[i+1] < x <= X[i+2], the interval to the right
+            return i + 1
+    return max(0, np.searchsorted(X, x) - 1)
+
+
+@nb.njit
+def ppval1_two_hint(x, X, Yppc, Zppc, i, d=0):
+    """
+    Evaluate two piecewise polynomials, starting the search from a hint.
+
+    As `ppval1_two`, but the search for the interval of `X` containing `x`
+    begins at the interval `i`.  A third output gives the interval containing
+    `x`, to be passed as `i` in a subsequent call.  If `x` is out of range,
+    the outputs are nan, nan, and the input `i`.
+    """
+    if np.isnan(x) or x < X[0] or X[-1] < x or np.isnan(X[0]):
+        return np.nan, np.nan, i
+    i = _searchsorted_hint(x, X, i)
+    dx = x - X[i]  # >= 0
+    return ppval_i(dx, Yppc, i, d), ppval_i(dx, Zppc, i, d), i
+
+
 @nb.guvectorize(
     [(nb.f8, nb.f8[:], nb.f8[:, :], nb.f8[:, :], nb.i8, nb.f8[:], nb.f8[:])],
     "(),(n),(n,m),(n,m),()->(),()",
@@ -9,6 +9,7 @@ from neutralocean.surface.isopycnal import _isopycnal
 from neutralocean.surface._vertsolve import _make_vertsolve
 from neutralocean.interp1d import make_interpolator
 from neutralocean.ppinterp import select_ppc
+from neutralocean.eos.tools import make_eos_diff
 from neutralocean.bfs import bfs_conncomp1, bfs_conncomp1_wet
 from neutralocean.grid.graph import edges_to_graph
 from neutralocean.ntp import ntp_epsilon_errors, ntp_epsilon_errors_norms
@@ -271,7 +272,13 @@ def omega_surf(S, T, P, grid, **kwargs):
     pin_cast = _process_pin_cast(pin_cast, S)  # call before _process_casts
     S, T, P = _process_casts(S, T, P, vert_dim)
     n_good = _process_n_good(S, n_good)  # call after _process_casts
+    # Difference of eos between two parcels at the same pressure or depth,
+    # for wetting.  When eos is a str, build this before processing eos, so a
+    # fused implementation is used where available.
+    eos_diff = make_eos_diff(eos, grav, rho_c) if isinstance(eos, str) else None
     eos, eos_s_t = _process_eos(eos, grav, rho_c, need_s_t=True)
+    if eos_diff is None:
+        eos_diff = make_eos_diff(eos)
 
     # Save shape of horizontal dimensions, then flatten horiz dims to 1D.
     surf_shape = n_good.shape
@@ -435,7 +442,7 @@ def omega_surf(S, T, P, grid, **kwargs):
                 P,
                 n_good,
                 TOL_P_SOLVER,
-                eos,
+                eos_diff,
                 ppc_fn,
                 p_ml,
             )
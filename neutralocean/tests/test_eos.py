@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from neutralocean.eos.tools import vectorize_eos
+from neutralocean.eos.tools import vectorize_eos, make_eos, make_eos_diff
 
 from neutralocean.eos.jmd95 import rho as rho_jmd95
 from neutralocean.eos.jmd95 import rho_s_t as rho_s_t_jmd95
@@ -19,6 +19,10 @@ from neutralocean.eos.gsw import specvol as specvol_gsw
 from neutralocean.eos.gsw import specvol_s_t as specvol_s_t_gsw
 from neutralocean.eos.gsw import specvol_p as specvol_p_gsw
 
+from neutralocean.eos.roquet55 import rho as rho_roquet55
+from neutralocean.eos.roquet55 import rho_s_t as rho_s_t_roquet55
+from neutralocean.eos.roquet55 import rho_p as rho_p_roquet55
+
 checkval_jmd95 = (35.5, 3.0, 3000.0, 1041.83267)
 rho_jmd95_ufunc = vectorize_eos(rho_jmd95)
 
@@ -33,6 +37,8 @@ rho_jmd95_ufunc = vectorize_eos(rho_jmd95)
         (rho_jmdfwg06, (40.0, 12.0, 8000.0, 1062.95279820631), 11),
         (rho_gsw, (35.0, 25.0, 2000.0, 1031.534727150376), 12),
         (specvol_gsw, (35.0, 25.0, 2000.0, 9.694293111803510e-04), 18),
+        (rho_roquet55, (35.0, 15.0, 0.0, 1025.8476941561), 10),
+        (rho_roquet55, (38.0, 15.0, 6000.0, 1052.7759428107), 10),
     ],
 )
 def test_checkval(eos, checkval, decimals):
@@ -61,6 +67,7 @@ def test_jmd95_ufunc_array():
         (rho_jmdfwg06, rho_s_t_jmdfwg06, rho_p_jmdfwg06),
         (rho_gsw, rho_s_t_gsw, rho_p_gsw),
         (specvol_gsw, specvol_s_t_gsw, specvol_p_gsw),
+        (rho_roquet55, rho_s_t_roquet55, rho_p_roquet55),
     ],
 )
 def test_rho_derivs(eos, eos_s_t, eos_p):
@@ -106,3 +113,28 @@ def test_rho_derivs(eos, eos_s_t, eos_p):
     assert np.isclose(rs_centred, rs, atol=0, rtol=1e-8)
     assert np.isclose(rt_centred, rt, atol=0, rtol=1e-8)
     assert np.isclose(rp_centred, rp, atol=0, rtol=1e-8)
+
+
+@pytest.mark.parametrize("eos", ["gsw", "jmd95", "jmdfwg06", "roquet55"])
+@pytest.mark.parametrize("grav,rho_c", [(None, None), (9.81, 1027.5)])
+@pytest.mark.parametrize(
+    "s1,t1,s2,t2,p",
+    [(35.0, 25.0, 34.5, 3.0, 2000.0), (35.0, 10.0, 35.001, 10.002, 4000.0)],
+)
+def test_eos_diff(eos, grav, rho_c, s1, t1, s2, t2, p):
+    eos_diff = make_eos_diff(eos, grav, rho_c)
+    eos = make_eos(eos, grav, rho_c)
+    # Allow for roundoff in each eos evaluation
+    atol = abs(eos(s1, t1, p)) * 1e-14
+    assert np.isclose(
+        eos_diff(s1, t1, s2, t2, p),
+        eos(s1, t1, p) - eos(s2, t2, p),
+        atol=atol,
+        rtol=1e-10,
+    )
+
+
+def test_make_eos_cached():
+    # Repeated calls return the same function, so nothing is recompiled
+    assert make_eos("jmd95", 9.81, 1035.0) is make_eos("jmd95", 9.81, 1035.0)
+    assert make_eos_diff("gsw") is make_eos_diff("gsw")
@@ -1,7 +1,7 @@
 import pytest
 import numpy as np
 import numba
-from neutralocean.fzero import brent_guess
+from neutralocean.fzero import brent_guess, brent, aps
 
 tol = 1e-6
 
@@ -61,3 +61,52 @@ def test_ub_eq_root_singular():
 def test_lb_eq_root_singular():
     root = brent_guess(univar_args, 4.0, 2.5, 6.0, tol, (2,))
     assert abs(root - 2.5) < tol
+
+
+# Test when the initial guess is at one end of the search range, and the
+# function has the same sign at that end as at the start of the expanding search
+def test_guess_eq_lb():
+    root = brent_guess(univar, 0.0, 0.0, 6.0, tol)
+    assert abs(root - 2.5) < tol
+
+
+def test_guess_eq_ub():
+    root = brent_guess(univar, 6.0, 0.0, 6.0, tol)
+    assert abs(root - 2.5) < tol
+
+
+@numba.njit
+def univar_exp(x):
+    return np.exp(x) - 3.0
+
+
+@numba.njit
+def linear(x, r):
+    return 3.0 * (x - r)
+
+
+# Test Alefeld-Potra-Shi agrees with Brent
+@pytest.mark.parametrize("func", [univar, univar3, univar_exp])
+def test_aps(func):
+    root = aps(func, 0.0, 6.0, tol)
+    assert abs(root - brent(func, 0.0, 6.0, tol)) < 2 * tol
+
+
+# Test a linear function whose root is very near the middle of the range, where
+# the first secant step lands within roundoff of the root
+@pytest.mark.parametrize("r", [1e-12, -3e-7, 0.0])
+def test_aps_linear(r):
+    root = aps(linear, -1.0, 1.0, 1e-10, (r,))
+    assert abs(root - r) < 1e-10
+
+
+def test_aps_no_sign_change():
+    assert np.isnan(aps(univar_args, 0.0, 6.0, tol, (2,)))
+
+
+# Test early exit when f is within ftol of zero
+@pytest.mark.parametrize("method", [brent, aps])
+def test_ftol(method):
+    root = method(univar3, 0.0, 6.0, 1e-14, (), 1e-3)
+    assert abs(univar3(root)) <= 1e-3
+    assert abs(root - 2.5) > 1e-14  # stopped before meeting the x tolerance
@@ -3,7 +3,7 @@ import pytest
 
 from neutralocean.lib import find_first_nan
 from neutralocean.interp1d import make_interpolator
-from neutralocean.ppinterp import select_ppc, ppval
+from neutralocean.ppinterp import select_ppc, ppval, ppval1_two, ppval1_two_hint
 from scipy.interpolate import UnivariateSpline, PchipInterpolator
 
 N = 4  # number of 1D interpolation problems
@@ -83,3 +83,17 @@ def test_interp(interp, num_deriv, x):
     # assert np.array_equal(y1, y2, equal_nan=True)
 
     assert np.allclose(y1, y2, equal_nan=True)
+
+
+@pytest.mark.parametrize("interp", ["linear", "pchip"])
+def test_ppval1_two_hint(interp):
+    # Searching from any hint gives the same result as a binary search
+    ppc_fn = select_ppc(interp, "1")
+    Yppc = ppc_fn(X1, Y[2])
+    Zppc = ppc_fn(X1, Y[0])
+    for x in x_targets:
+        y, z = ppval1_two(x, X1, Yppc, Zppc)
+        for i in range(-1, K + 1):
+            y1, z1, j = ppval1_two_hint(x, X1, Yppc, Zppc, i)
+            assert y1 == y and z1 == z
+            assert j == max(0, np.searchsorted(X1, x) - 1)
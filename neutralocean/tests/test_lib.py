@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from neutralocean.lib import find_first_nan, find_first_nan_2d
+
+# Rows with all NaN's, no NaN's, and NaN's partway down
+a = np.array(
+    [
+        [np.nan, np.nan, np.nan, np.nan],
+        [1.0, 2.0, 3.0, 4.0],
+        [1.0, 2.0, np.nan, np.nan],
+        [1.0, np.nan, 3.0, np.nan],
+        [np.nan, 2.0, 3.0, 4.0],
+    ]
+)
+k_true = np.array([0, 4, 2, 1, 0])
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_find_first_nan(dtype):
+    x = a.astype(dtype)
+    assert np.array_equal(find_first_nan(x), k_true)
+    assert np.array_equal(find_first_nan(x.reshape(5, 1, 4))[:, 0], k_true)
+    assert all(find_first_nan(x[i])[()] == k_true[i] for i in range(5))
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_find_first_nan_2d(dtype):
+    x = a.astype(dtype)
+    assert np.array_equal(find_first_nan_2d(x), find_first_nan(x))
+    assert np.array_equal(find_first_nan_2d(x[:, ::-1]), find_first_nan(x[:, ::-1]))
@@ -0,0 +1,219 @@
+import types
+
+import numpy as np
+import numba as nb
+import pytest
+
+import neutralocean
+import neutralocean.traj
+
+from neutralocean.eos.tools import make_eos, vectorize_eos
+from neutralocean.eos.jmd95 import rho as rho_jmd95
+from neutralocean.synthocean import synthocean
+from neutralocean.traj import (
+    neutral_trajectory,
+    neutral_trajectories_batch,
+    ntp_bottle_to_cast,
+    _aot,
+    _check_precompiled,
+)
+
+eos = make_eos(rho_jmd95)
+eos_ufunc = vectorize_eos(eos)
+
+
+def make_casts(nc=20, nk=50):
+    # A sequence of casts along a parallel of the synthetic ocean, with casts
+    # on the first dimension and depth on the second.
+    S, T, P, _ = synthocean((nc + 1, 3, nk))
+    S = np.ascontiguousarray(S[1:, 1, :])
+    T = np.ascontiguousarray(T[1:, 1, :])
+    P = np.tile(P, (nc, 1))
+    return S, T, P
+
+
+@pytest.mark.parametrize("method", ["brent", "aps"])
+@pytest.mark.parametrize("interp", ["linear", "pchip"])
+def test_neutral_trajectory(interp, method):
+    S, T, P = make_casts()
+    tol_p = 1e-8
+    s, t, p = neutral_trajectory(
+        S, T, P, 1500.0, tol_p=tol_p, interp=interp, eos=eos, method=method
+    )
+
+    assert p[0] == 1500.0
+    assert np.all(np.isfinite(p))
+
+    # Each pair of adjacent bottles on the trajectory is neutrally related
+    p_avg = (p[:-1] + p[1:]) * 0.5
+    d = eos_ufunc(s[:-1], t[:-1], p_avg) - eos_ufunc(s[1:], t[1:], p_avg)
+    assert np.allclose(d, 0.0, atol=1e-9)
+
+
+def test_neutral_trajectory_tol_eos():
+    # Root-finding stops once the density difference is within tol_eos, well
+    # before the tight tol_p is met, so the trajectory differs from that found
+    # with tol_eos = 0
+    S, T, P = make_casts()
+    tol_eos = 1e-4
+    s0, t0, p0 = neutral_trajectory(S, T, P, 1500.0, tol_p=1e-6, eos=eos)
+    s, t, p = neutral_trajectory(S, T, P, 1500.0, tol_p=1e-6, eos=eos, tol_eos=tol_eos)
+    p_avg = (p[:-1] + p[1:]) * 0.5
+    d = eos_ufunc(s[:-1], t[:-1], p_avg) - eos_ufunc(s[1:], t[1:], p_avg)
+    assert np.all(np.abs(d) <= tol_eos)
+    assert np.max(np.abs(d)) > 1e-2 * tol_eos  # much larger than tol_p allows
+    assert np.max(np.abs(p - p0)) > 1e-3
+
+
+def test_neutral_trajectories_batch():
+    # Each trajectory in the batch matches the trajectory calculated alone
+    S, T, P = make_casts()
+    p0 = np.array([500.0, 1500.0, 2500.0, 3000.0])
+    s, t, p = neutral_trajectories_batch(S, T, P, p0, eos=eos)
+    assert p.shape == (p0.size, S.shape[0])
+    for i in range(p0.size):
+        stp = neutral_trajectory(S, T, P, p0[i], eos=eos)
+        assert all(np.array_equal(x[i], y) for x, y in zip((s, t, p), stp))
+
+
+def test_neutral_trajectory_eos_str():
+    # An eos given by name, here one with a fused eos difference
+    S, T, P = make_casts()
+    s, t, p = neutral_trajectory(S, T, P, 1500.0, tol_p=1e-8, eos="roquet55")
+    assert np.all(np.isfinite(p))
+
+    eos_ufunc = vectorize_eos(make_eos("roquet55"))
+    p_avg = (p[:-1] + p[1:]) * 0.5
+    d = eos_ufunc(s[:-1], t[:-1], p_avg) - eos_ufunc(s[1:], t[1:], p_avg)
+    assert np.allclose(d, 0.0, atol=1e-9)
+
+
+def test_neutral_trajectory_outcrop():
+    # A trajectory that incrops (hits land) is nan on all subsequent casts
+    S, T, P = make_casts()
+    S[5:, 10:] = T[5:, 10:] = np.nan
+    s, t, p = neutral_trajectory(S, T, P, 3000.0, eos=eos)
+    assert np.all(np.isfinite(p[:5]))
+    assert np.all(np.isnan(s[5:]) & np.isnan(t[5:]) & np.isnan(p[5:]))
+
+
+def test_neutral_trajectory_order():
+    # Result does not depend on the memory layout of the inputs
+    S, T, P = make_casts()
+    stp = neutral_trajectory(S, T, P, 1500.0, eos=eos)
+    S, T, P = (np.asfortranarray(x) for x in (S, T, P))
+    stp_F = neutral_trajectory(S, T, P, 1500.0, eos=eos)
+    assert all(np.array_equal(x, y) for x, y in zip(stp, stp_F))
+
+
+def test_neutral_trajectory_float32():
+    # Single precision data give the same result as the same data promoted to
+    # double precision, since all calculations are in double precision.
+    S, T, P = (x.astype(np.float32) for x in make_casts())
+    stp32 = neutral_trajectory(S, T, P, 1500.0, eos=eos)
+    S, T, P = (x.astype(np.float64) for x in (S, T, P))
+    stp64 = neutral_trajectory(S, T, P, 1500.0, eos=eos)
+    assert all(x.dtype == np.float64 for x in stp32)
+    assert all(np.array_equal(x, y) for x, y in zip(stp32, stp64))
+
+
+@pytest.mark.skipif(_aot is None, reason="neutralocean_core not built")
+@pytest.mark.parametrize("interp", ["linear", "pchip"])
+def test_precompiled(interp):
+    # The ahead-of-time compiled functions match the just-in-time compiled ones
+    S, T, P = make_casts()
+    stp_aot = neutral_trajectory(S, T, P, 1500.0, interp=interp, eos="jmd95")
+    stp_jit = neutral_trajectory(S, T, P, 1500.0, interp=interp, eos=eos)
+    assert all(np.allclose(x, y) for x, y in zip(stp_aot, stp_jit))
+
+    args = (S[0, 20], T[0, 20], P[0, 20], S[1], T[1], P[1])
+    stp_aot = ntp_bottle_to_cast(*args, interp=interp, eos="jmd95")
+    stp_jit = ntp_bottle_to_cast(*args, interp=interp, eos=eos)
+    assert np.allclose(stp_aot, stp_jit)
+
+
+def fake_core(neutralocean_version, numba_version):
+    # Stands in for the neutralocean_core extension, whose functions return
+    # their name, so dispatch can be tested without building the extension.
+    mod = types.SimpleNamespace(
+        neutralocean_version=lambda: neutralocean_version,
+        numba_version=lambda: numba_version,
+    )
+    for name in ("ntp_bottle_to_cast", "neutral_trajectory"):
+        for interp in ("linear", "pchip"):
+            f = f"{name}_jmd95_{interp}"
+            setattr(mod, f, lambda *args, f=f: f)
+    return mod
+
+
+def test_check_precompiled():
+    mod = fake_core(neutralocean.__version__, nb.__version__)
+    assert _check_precompiled(mod) is mod
+    with pytest.warns(UserWarning, match="Rebuild"):
+        assert _check_precompiled(fake_core("0.0.0", nb.__version__)) is None
+    with pytest.warns(UserWarning, match="Rebuild"):
+        assert _check_precompiled(types.SimpleNamespace()) is None
+
+
+def test_precompiled_dispatch(monkeypatch):
+    # Matching calls go to the extension; others are compiled just-in-time
+    mod = fake_core(neutralocean.__version__, nb.__version__)
+    monkeypatch.setattr(neutralocean.traj, "_aot", mod)
+    S, T, P = make_casts(nc=3)
+    args = (S[0, 20], T[0, 20], P[0, 20], S[1], T[1], P[1])
+    assert ntp_bottle_to_cast(*args, eos="jmd95") == "ntp_bottle_to_cast_jmd95_linear"
+    for kwargs in (
+        dict(eos="gsw"),
+        dict(eos="jmd95", method="aps"),
+        dict(eos="jmd95", tol_eos=1e-6),
+        dict(eos="jmd95", grav=9.81, rho_c=1027.5),
+    ):
+        assert not isinstance(ntp_bottle_to_cast(*args, **kwargs), str)
+    for n_good in (0, 1):  # too few data to bracket a root, e.g. land
+        stp = ntp_bottle_to_cast(*args, eos="jmd95", n_good=n_good)
+        assert np.all(np.isnan(stp))
+    stp = neutral_trajectory(S, T, P, 1500.0, interp="pchip", eos="jmd95")
+    assert stp == "neutral_trajectory_jmd95_pchip"
+    S, T, P = (x.astype(np.float32) for x in (S, T, P))
+    stp = neutral_trajectory(S, T, P, 1500.0, eos="jmd95")
+    assert not isinstance(stp, str)
+
+
+def test_ntp_bottle_to_cast():
+    S, T, P = make_casts()
+    sB, tB, pB = S[0, 20], T[0, 20], P[0, 20]
+    s, t, p = ntp_bottle_to_cast(sB, tB, pB, S[1], T[1], P[1], tol_p=1e-8, eos=eos)
+    p_avg = (pB + p) * 0.5
+    assert abs(eos(sB, tB, p_avg) - eos(s, t, p_avg)) < 1e-9
+
+
+def test_ntp_bottle_to_cast_n_good():
+    # Giving n_good matches scanning for it, and data below it are ignored
+    S, T, P = make_casts()
+    args = (S[0, 20], T[0, 20], P[0, 20], S[1], T[1], P[1])
+    stp = ntp_bottle_to_cast(*args, eos=eos)
+    assert stp == ntp_bottle_to_cast(*args, eos=eos, n_good=S.shape[1])
+
+    S1 = S[1].copy()
+    S1[25:] = np.nan
+    stp = ntp_bottle_to_cast(S[0, 20], T[0, 20], P[0, 20], S1, T[1], P[1], eos=eos)
+    assert stp == ntp_bottle_to_cast(*args, eos=eos, n_good=25)
+
+
+@nb.njit
+def eos_salt(s, t, p):
+    # A toy equation of state: density is salinity
+    return s
+
+
+def test_ntp_bottle_to_cast_narrow():
+    # The only neutral connections lie within a thin salty layer, far from the
+    # bottle's pressure.  The search expanding outward from the bottle steps
+    # over this layer, so the sign change must be found by scanning the cast.
+    P = np.linspace(0.0, 100.0, 101)
+    S = np.full(P.size, 34.0)
+    S[51] = 36.0
+    T = np.zeros(P.size)
+    s, t, p = ntp_bottle_to_cast(35.0, 0.0, 0.0, S, T, P, eos=eos_salt)
+    assert s == 35.0
+    assert p == 50.5
@@ -1,23 +1,76 @@
 """Neutral Trajectory and related functions"""
 
+import warnings
+
 import numpy as np
 import numba as nb
 
-from neutralocean.ppinterp import select_ppc, ppval1_two
-from neutralocean.eos.tools import make_eos
-from neutralocean.fzero import guess_to_bounds, brent
-from neutralocean.lib import find_first_nan
+from neutralocean import __version__
+from neutralocean.ppinterp import select_ppc, ppval1_two, ppval1_two_hint
+from neutralocean.eos.tools import make_eos_diff
+from neutralocean.fzero import guess_to_bounds, brent, select_zero
+from neutralocean.lib import find_first_nan, find_first_nan_2d
+
+
+def _check_precompiled(mod):
+    """Return `mod` if it was built with the installed neutralocean and Numba, else None"""
+    try:
+        built = (mod.neutralocean_version(), mod.numba_version())
+    except AttributeError:
+        built = ("unknown", "unknown")
+    if built != (__version__, nb.__version__):
+        warnings.warn(
+            "Ignoring neutralocean_core, which was built for neutralocean "
+            f"{built[0]} and Numba {built[1]}, but neutralocean {__version__} "
+            f"and Numba {nb.__version__} are installed.  Rebuild it by running "
+            "`python -m neutralocean._precompiled`."
+        )
+        return None
+    return mod
+
+
+try:
+    # Ahead-of-time compiled functions, built by `neutralocean._precompiled`
+    from neutralocean import neutralocean_core as _aot
+except ImportError:
+    _aot = None
+else:
+    _aot = _check_precompiled(_aot)
+
+
+def _precompiled(name, eos, interp, grav, rho_c, method, tol_eos):
+    """Return the ahead-of-time compiled `name` for `eos` and `interp`, or None"""
+    if _aot is None or not isinstance(eos, str) or method != "brent":
+        return None
+    if tol_eos != 0.0:
+        return None
+    if grav is not None or rho_c is not None:
+        return None  # Boussinesq forms are not precompiled
+    return getattr(_aot, f"{name}_{eos}_{interp}", None)
 
 
 @nb.njit
-def _func(p, sB, tB, pB, Sppc, Tppc, P, eos):
+def _func(p, sB, tB, pB, Sppc, Tppc, P, eos_diff, idx):
     # Evaluate difference between (a) eos at location on the cast (S, T, P)
     # where the pressure or depth is p, and (b) eos of the bottle (sB, tB, pB)
     # here, eos is always evaluated at the average pressure or depth, (p +
     # pB)/2.
-    s, t = ppval1_two(p, P, Sppc, Tppc)
+    # idx is a 1 element array holding the interval of P where the last
+    # evaluation happened; successive root-finding iterates are close, so
+    # start searching for the interval containing p from there.
+    s, t, idx[0] = ppval1_two_hint(p, P, Sppc, Tppc, idx[0])
+    p_avg = (pB + p) * 0.5
+    return eos_diff(sB, tB, s, t, p_avg)
+
+
+@nb.njit
+def _func_linear_segment(p, sB, tB, pB, Pa, Sa, dSdP, Ta, dTdP, eos_diff):
+    # As `_func`, but with S and T interpolated linearly from (Pa, Sa, Ta)
+    # with slopes dSdP and dTdP, i.e. within one segment of the cast.
+    s = dSdP * (p - Pa) + Sa
+    t = dTdP * (p - Pa) + Ta
     p_avg = (pB + p) * 0.5
-    return eos(sB, tB, p_avg) - eos(s, t, p_avg)
+    return eos_diff(sB, tB, s, t, p_avg)
 
 
 def ntp_bottle_to_cast(
@@ -32,6 +85,9 @@ def ntp_bottle_to_cast(
     eos="gsw",
     grav=None,
     rho_c=None,
+    method="brent",
+    tol_eos=0.0,
+    n_good=None,
 ):
     """Find the neutral tangent plane from a bottle to a cast
 
@@ -41,7 +97,7 @@ def ntp_bottle_to_cast(
     That is, the density of `(s, t, p_avg)` very nearly equals the density
     of `(sB, tB, p_avg)`, where `p_avg = (p + pB) / 2`.  Within `tol_p` of this
     point on the cast, there is a point where these two densities are exactly
-    equal.
+    equal, unless `tol_eos` is positive (see below).
 
     Parameters
     ----------
@@ -88,8 +144,11 @@ def ntp_bottle_to_cast(
         If a function, this should be @numba.njit decorated and need not be
         vectorized, as it will be called many times with scalar inputs.
 
-        If a str, can be either 'gsw' to use TEOS-10
-        or 'jmd' to use Jackett and McDougall (1995) [1]_.
+        If a str, can be any of the strings accepted by
+        `neutralocean.eos.make_eos`, e.g. 'gsw' to use TEOS-10,
+        'roquet55' to use the Roquet et al. (2015) polynomial approximation
+        of TEOS-10 (which is faster), or 'jmd95' to use Jackett and
+        McDougall (1995) [1]_.
 
     grav : float, Default None
 
@@ -99,24 +158,76 @@ def ntp_bottle_to_cast(
 
         Boussinesq reference desnity [kg m-3].  When non-Boussinesq, pass None.
 
+    method : str, Default 'brent'
+
+        Method for bracketed root-finding.  Use 'brent' for Brent's method,
+        or 'aps' for Algorithm 4.2 of Alefeld, Potra, and Shi (1995).  See
+        `neutralocean.fzero`.
+
+    tol_eos : float, Default 0.0
+
+        Error tolerance in terms of the difference in the equation of state
+        between the bottle and the cast, in the units of `eos` (e.g. m3 kg-1
+        for 'gsw', which is specific volume).  Root-finding also stops as
+        soon as this difference is within `tol_eos` of zero.  This saves
+        iterations in weakly stratified water, where the difference changes
+        slowly with pressure or depth, i.e. where its vertical derivative is
+        smaller than `tol_eos / tol_p`.  There, the result can be further
+        than `tol_p` from the exact neutral point, so a nonzero `tol_eos`
+        forfeits the guarantee given by `tol_p`.  When 0, only `tol_p` is
+        used.
+
+    n_good : int, Default None
+
+        Number of valid (non-NaN) data on the cast, which must be its first
+        `n_good` data.  If None, this is found by scanning `S` for NaN's.
+        When calling repeatedly with casts known to have no NaN's, pass
+        `n_good=len(S)` to skip this scan.
+
     Notes
     -----
     .. [1] Jackett and McDougall, 1995, JAOT 12(4), pp. 381-388
 
     """
 
-    eos = make_eos(eos, grav, rho_c)
+    if (n_good is not None and n_good < 2) or len(P) < 2:
+        # The cast has too few valid data to bracket a root, e.g. it is land
+        return np.nan, np.nan, np.nan
+
+    fn = _precompiled("ntp_bottle_to_cast", eos, interp, grav, rho_c, method, tol_eos)
+    if fn is not None:
+        S, T, P = (np.asarray(x, dtype=np.float64)[:n_good] for x in (S, T, P))
+        return fn(float(sB), float(tB), float(pB), S, T, P, float(tol_p))
+
+    eos_diff = make_eos_diff(eos, grav, rho_c)
     ppc_fn = select_ppc(interp, "1")
-    n_good = find_first_nan(S)
+    zero_fn = select_zero(method)
+    if n_good is None:
+        n_good = find_first_nan(S)[()]
 
     Sppc = ppc_fn(P, S)
     Tppc = ppc_fn(P, T)
 
-    return _ntp_bottle_to_cast(sB, tB, pB, Sppc, Tppc, P, n_good, tol_p, eos)
+    return _ntp_bottle_to_cast(
+        sB, tB, pB, Sppc, Tppc, P, n_good, tol_p, eos_diff, 0.0, zero_fn, tol_eos
+    )
 
 
 @nb.njit
-def _ntp_bottle_to_cast(sB, tB, pB, Sppc, Tppc, P, n_good, tol_p, eos):
+def _ntp_bottle_to_cast(
+    sB,
+    tB,
+    pB,
+    Sppc,
+    Tppc,
+    P,
+    n_good,
+    tol_p,
+    eos_diff,
+    dp_init=0.0,
+    zero_fn=brent,
+    tol_eos=0.0,
+):
     """Find the neutral tangent plane from a bottle to a cast
 
     Fast version of `ntp_bottle_to_cast`, with all inputs supplied.
@@ -141,9 +252,11 @@ def _ntp_bottle_to_cast(sB, tB, pB, Sppc, Tppc, P, n_good, tol_p, eos):
         and `T` are the salinity and temperature on the cast, from which `Sppc`
         and `Tppc` were constucted.
 
-    eos : function
-        Equation of state for the density or specific volume as a function of
-        `S`, `T`, and pressure or depth inputs.
+    eos_diff : function
+        Difference of the equation of state for the density or specific
+        volume between two parcels at the same pressure or depth, as a
+        function of `(s1, t1, s2, t2, p)` inputs.  See
+        `neutralocean.eos.make_eos_diff`.
 
         This function should be @numba.njit decorated and need not be
         vectorized, as it will be called many times with scalar inputs.
@@ -151,6 +264,17 @@ def _ntp_bottle_to_cast(sB, tB, pB, Sppc, Tppc, P, n_good, tol_p, eos):
     tol_p : float, Default 1e-4
         See ntp_bottle_to_cast
 
+    dp_init : float, Default 0.0
+        Initial distance to expand outward from `pB` when searching for a
+        sign change.  See `guess_to_bounds`.
+
+    zero_fn : function, Default `brent`
+        Function for bracketed root-finding, as from
+        `neutralocean.fzero.select_zero(method)`.
+
+    tol_eos : float, Default 0.0
+        See ntp_bottle_to_cast
+
     Returns
     -------
     s, t, p : float
@@ -159,18 +283,52 @@ def _ntp_bottle_to_cast(sB, tB, pB, Sppc, Tppc, P, n_good, tol_p, eos):
 
     if n_good > 1:
 
-        args = (sB, tB, pB, Sppc, Tppc, P, eos)
+        idx = np.zeros(1, dtype=np.int64)
+        args = (sB, tB, pB, Sppc, Tppc, P, eos_diff, idx)
 
         # Search for a sign-change, expanding outward from an initial guess
-        lb, ub = guess_to_bounds(_func, pB, P[0], P[n_good - 1], args)
+        lb, ub = guess_to_bounds(_func, pB, P[0], P[n_good - 1], args, dp_init)
+
+        if not np.isfinite(lb):
+            # The expanding search can step over a pair of nearby roots.
+            # Check for a sign change between each pair of adjacent data.
+            lb, ub = _bracket_by_scan(sB, tB, pB, Sppc, Tppc, P, n_good, eos_diff)
 
         if np.isfinite(lb):
             # A sign change was discovered, so a root exists in the interval.
-            # Solve the nonlinear root-finding problem using Brent's method
-            p = brent(_func, lb, ub, tol_p, args)
-
-            # Interpolate S and T onto the updated surface
-            s, t = ppval1_two(p, P, Sppc, Tppc)
+            # Restrict the cast to the few data spanning [lb, ub], so that
+            # the root-finding searches only these for the interval holding
+            # each iterate.  Slices are views, so this copies nothing.
+            # Here, P[i] <= lb < P[i+1] and P[j-2] < ub <= P[j-1].
+            i = min(np.searchsorted(P[:n_good], lb, side="right") - 1, n_good - 2)
+            j = max(i + 2, np.searchsorted(P[:n_good], ub) + 1)
+
+            if j - i == 2 and Sppc.shape[1] == 2:
+                # [lb, ub] lies within one segment of a linear interpolant, so
+                # evaluate it without searching the cast or indexing arrays.
+                # There is no closed form for the root: though S and T are
+                # linear in p here, every eos depends on sqrt(S), and some are
+                # rational in p, so the eos difference is not a polynomial in p.
+                Sa, dSdP, Ta, dTdP = Sppc[i, 1], Sppc[i, 0], Tppc[i, 1], Tppc[i, 0]
+                args_lin = (sB, tB, pB, P[i], Sa, dSdP, Ta, dTdP, eos_diff)
+
+                # Solve the nonlinear root-finding problem
+                p = zero_fn(_func_linear_segment, lb, ub, tol_p, args_lin, tol_eos)
+
+                # Interpolate S and T onto the updated surface
+                s = dSdP * (p - P[i]) + Sa
+                t = dTdP * (p - P[i]) + Ta
+
+            else:
+                idx[0] = 0
+                Sppc, Tppc, P = Sppc[i:j], Tppc[i:j], P[i:j]
+                args_seg = (sB, tB, pB, Sppc, Tppc, P, eos_diff, idx)
+
+                # Solve the nonlinear root-finding problem
+                p = zero_fn(_func, lb, ub, tol_p, args_seg, tol_eos)
+
+                # Interpolate S and T onto the updated surface
+                s, t, _ = ppval1_two_hint(p, P, Sppc, Tppc, idx[0])
 
         else:
             s, t, p = np.nan, np.nan, np.nan
@@ -181,6 +339,54 @@ def _ntp_bottle_to_cast(sB, tB, pB, Sppc, Tppc, P, n_good, tol_p, eos):
     return s, t, p
 
 
+@nb.njit
+def _bracket_by_scan(sB, tB, pB, Sppc, Tppc, P, n_good, eos_diff):
+    """Find adjacent data on a cast between which `_func` changes sign
+
+    Evaluates `_func` at every valid datum on the cast in a single pass.
+    This is a fallback for `guess_to_bounds`, which can miss sign changes
+    that lie close together.
+
+    Parameters
+    ----------
+    sB, tB, pB, Sppc, Tppc, P, n_good, eos_diff :
+        See _ntp_bottle_to_cast
+
+    Returns
+    -------
+    lb, ub : float
+        `P[k]` and `P[k+1]` for the `k` such that `_func` changes sign between
+        these two data, choosing the `k` closest to `pB` if there are many.
+        If `_func` is zero at a datum, both outputs are that value of `P`.
+        If there are no sign changes, both outputs are nan.
+    """
+
+    lb, ub = np.nan, np.nan
+    dist = np.inf  # distance from pB to the best bracket found so far
+
+    # The value of the interpolants at `P[k]` are the constant terms of the
+    # `k`'th piece of the piecewise polynomials.
+    d1 = eos_diff(sB, tB, Sppc[0, -1], Tppc[0, -1], (pB + P[0]) * 0.5)
+    if d1 == 0.0:
+        return P[0], P[0]
+    for k in range(1, n_good):
+        d0 = d1
+        d1 = eos_diff(sB, tB, Sppc[k, -1], Tppc[k, -1], (pB + P[k]) * 0.5)
+        if d1 == 0.0:
+            if abs(P[k] - pB) < dist:
+                lb, ub = P[k], P[k]
+                dist = abs(P[k] - pB)
+        elif (d0 > 0.0) != (d1 > 0.0):
+            dk = max(P[k - 1] - pB, pB - P[k], 0.0)
+            if dk < dist:
+                lb, ub = P[k - 1], P[k]
+                dist = dk
+        if P[k] > pB and dist <= P[k] - pB:
+            break  # remaining data are farther from pB than the best bracket
+
+    return lb, ub
+
+
 # To do: add vert_dim argument
 def neutral_trajectory(
     S,
@@ -192,6 +398,8 @@ def neutral_trajectory(
     eos="gsw",
     grav=None,
     rho_c=None,
+    method="brent",
+    tol_eos=0.0,
 ):
     """Calculate a neutral trajectory through a sequence of casts.
 
@@ -209,6 +417,9 @@ def neutral_trajectory(
         The first dimension specifies the cast number, while the second provides
         data on that cast; e.g. S[i,:] is the salinity down cast `i`.
 
+        Single precision (float32) data are not copied to double precision,
+        but all calculations are done in double precision.
+
     p0 : float
 
         The pressure / depth at which to begin the neutral trajectory on the first cast
@@ -241,8 +452,11 @@ def neutral_trajectory(
         If a function, this should be @numba.njit decorated and need not be
         vectorized, as it will be called many times with scalar inputs.
 
-        If a str, can be either 'gsw' to use TEOS-10
-        or 'jmd' to use Jackett and McDougall (1995) [1]_.
+        If a str, can be any of the strings accepted by
+        `neutralocean.eos.make_eos`, e.g. 'gsw' to use TEOS-10,
+        'roquet55' to use the Roquet et al. (2015) polynomial approximation
+        of TEOS-10 (which is faster), or 'jmd95' to use Jackett and
+        McDougall (1995) [1]_.
 
     grav : float, Default None
 
@@ -252,48 +466,310 @@ def neutral_trajectory(
 
         Boussinesq reference desnity [kg m-3].  When non-Boussinesq, pass None.
 
+    method : str, Default 'brent'
+
+        Method for bracketed root-finding.  Use 'brent' for Brent's method,
+        or 'aps' for Algorithm 4.2 of Alefeld, Potra, and Shi (1995).  See
+        `neutralocean.fzero`.
+
+    tol_eos : float, Default 0.0
+
+        Error tolerance in terms of the difference in the equation of state
+        between the bottle and the cast, in the units of `eos` (e.g. m3 kg-1
+        for 'gsw', which is specific volume).  Root-finding also stops as
+        soon as this difference is within `tol_eos` of zero.  This saves
+        iterations in weakly stratified water, where the difference changes
+        slowly with pressure or depth, i.e. where its vertical derivative is
+        smaller than `tol_eos / tol_p`.  There, the result can be further
+        than `tol_p` from the exact neutral point, so a nonzero `tol_eos`
+        forfeits the guarantee given by `tol_p`.  When 0, only `tol_p` is
+        used.
+
     Notes
     -----
     .. [1] Jackett and McDougall, 1995, JAOT 12(4), pp. 381-388
     """
 
-    eos = make_eos(eos, grav, rho_c)
+    # Each cast is accessed many times while root-finding, so ensure the data
+    # on each cast is contiguous in memory.  This is a no-op for C-ordered
+    # input, but copies if given e.g. the transpose of a C-ordered array.
+    # Single precision data are kept in single precision, halving the memory
+    # read; each cast is promoted to double precision as it is used.
+    S, T, P = (np.ascontiguousarray(x, dtype=_work_dtype(x)) for x in (S, T, P))
+
+    fn = _precompiled("neutral_trajectory", eos, interp, grav, rho_c, method, tol_eos)
+    if fn is not None and S.dtype == T.dtype == P.dtype == np.float64:
+        return fn(S, T, P, float(p0), float(tol_p))
+
+    eos_diff = make_eos_diff(eos, grav, rho_c)
     ppc_fn = select_ppc(interp, "1")
+    zero_fn = select_zero(method)
 
-    nc, nk = S.shape
     # assert(all(size(T) == size(S)), 'T must be same size as S')
     # assert(all(size(P) == size(S)) || all(size(P) == [nk, 1]), 'P must be [nk,nc] or [nk,1]')
 
-    s = np.full(nc, np.nan)
-    t = np.full(nc, np.nan)
-    p = np.full(nc, np.nan)
+    # Number of valid data on each cast
+    n_good = find_first_nan_2d(S)
+
+    return _neutral_trajectory_core(
+        S, T, P, n_good, p0, tol_p, eos_diff, ppc_fn, zero_fn, tol_eos
+    )
+
+
+def _work_dtype(x):
+    """Return float32 if `x` is single precision, else float64"""
+    return np.float32 if np.asarray(x).dtype == np.float32 else np.float64
+
+
+@nb.njit
+def _neutral_trajectory_core(
+    S, T, P, n_good, p0, tol_p, eos_diff, ppc_fn, zero_fn=brent, tol_eos=0.0
+):
+    """Calculate a neutral trajectory through a sequence of casts.
+
+    Fast version of `neutral_trajectory`, with all inputs supplied.  The loop
+    over casts is compiled, so `_ntp_bottle_to_cast` and the functions it
+    calls are inlined rather than dispatched from Python once per cast.
+
+    Parameters
+    ----------
+    S, T, P, p0, tol_p :
+        See neutral_trajectory
+
+    n_good : ndarray of int
+        Number of valid (non-NaN) data points on each cast.  Compute this as
+        `n_good = find_first_nan_2d(S)`.
+
+    eos_diff : function
+        Difference of the equation of state for the density or specific
+        volume between two parcels at the same pressure or depth, as a
+        function of `(s1, t1, s2, t2, p)` inputs.  See
+        `neutralocean.eos.make_eos_diff`.
+
+        This function should be @numba.njit decorated and need not be
+        vectorized, as it will be called many times with scalar inputs.
+
+    ppc_fn : function
+        Function to compute piecewise polynomial coefficients for an
+        interpolator, as from `neutralocean.ppinterp.select_ppc(interp, "1")`.
+
+    zero_fn : function, Default `brent`
+        Function for bracketed root-finding, as from
+        `neutralocean.fzero.select_zero(method)`.
+
+    tol_eos : float, Default 0.0
+        See neutral_trajectory
+
+    Returns
+    -------
+    s, t, p : 1D ndarray
+        See neutral_trajectory
+    """
+
+    nc = S.shape[0]
+
+    # Salinity, temperature, and pressure along the trajectory, with the
+    # three values on each cast adjacent in memory
+    stp = np.empty((nc, 3))
 
     # Evaluate S and T on first cast at p0
-    Sc = S[0, :]
-    Tc = T[0, :]
-    Pc = P[0, :]
-    Sppc = ppc_fn(Pc, Sc)
-    Tppc = ppc_fn(Pc, Tc)
-    s[0], t[0] = ppval1_two(p0, Pc, Sppc, Tppc)
-    p[0] = p0
-
-    # Loop over remaining casts
+    Pc = np.asarray(P[0], dtype=np.float64)
+    Sppc = ppc_fn(Pc, np.asarray(S[0], dtype=np.float64))
+    Tppc = ppc_fn(Pc, np.asarray(T[0], dtype=np.float64))
+    stp[0, 0], stp[0, 1] = ppval1_two(p0, Pc, Sppc, Tppc)
+    stp[0, 2] = p0
+
+    # Loop over remaining casts.  Each depends on the previous, so this is
+    # inherently serial.
     for c in range(1, nc):
 
-        Sc = S[c, :]
-        Tc = T[c, :]
-        Pc = P[c, :]
+        # Root-finding is done in double precision, even if the data are not.
+        # This copies single precision data, but not double precision data.
+        Sc = np.asarray(S[c], dtype=np.float64)
+        Tc = np.asarray(T[c], dtype=np.float64)
+        Pc = np.asarray(P[c], dtype=np.float64)
+
         Sppc = ppc_fn(Pc, Sc)
         Tppc = ppc_fn(Pc, Tc)
 
-        # Make a neutral connection from previous bottle to the cast (S[c,:], T[c,:], P[c,:])
-        K = find_first_nan(Sc)
-        s[c], t[c], p[c] = _ntp_bottle_to_cast(
-            s[c - 1], t[c - 1], p[c - 1], Sppc, Tppc, Pc, K, tol_p, eos
-        )
+        if _trajectory_step(
+            stp, c, Sppc, Tppc, Pc, n_good[c], tol_p, eos_diff, zero_fn, tol_eos
+        ):
+            break
+
+    return stp[:, 0], stp[:, 1], stp[:, 2]
+
+
+@nb.njit
+def _neutral_trajectory_ppc_core(
+    Sppc, Tppc, P, n_good, p0, tol_p, eos_diff, zero_fn=brent, tol_eos=0.0
+):
+    """Calculate a neutral trajectory through a sequence of casts.
+
+    As `_neutral_trajectory_core`, but given the interpolants for all casts.
+
+    Parameters
+    ----------
+    Sppc, Tppc : 3D ndarray
+        Piecewise Polynomial Coefficients for interpolants of Salinity and
+        Temperature in terms of `P` on each cast, such that `Sppc[c]` is as
+        from `ppc_fn(P[c], S[c])` for the `ppc_fn` of
+        `_neutral_trajectory_core`.
+
+    P : 2D ndarray
+        See neutral_trajectory.  Must be double precision.
+
+    n_good, p0, tol_p, eos_diff, zero_fn, tol_eos :
+        See _neutral_trajectory_core
+
+    Returns
+    -------
+    s, t, p : 1D ndarray
+        See neutral_trajectory
+    """
+
+    nc = Sppc.shape[0]
+    stp = np.empty((nc, 3))
 
-        if np.isnan(p[c]):
-            # The neutral trajectory incropped or outcropped
+    stp[0, 0], stp[0, 1] = ppval1_two(p0, P[0], Sppc[0], Tppc[0])
+    stp[0, 2] = p0
+
+    for c in range(1, nc):
+        if _trajectory_step(
+            stp, c, Sppc[c], Tppc[c], P[c], n_good[c], tol_p, eos_diff, zero_fn, tol_eos
+        ):
             break
 
+    return stp[:, 0], stp[:, 1], stp[:, 2]
+
+
+@nb.njit
+def _trajectory_step(stp, c, Sppc, Tppc, Pc, K, tol_p, eos_diff, zero_fn, tol_eos):
+    # Fill stp[c] by making a neutral connection from the bottle stp[c-1] to
+    # the cast c, whose interpolants are Sppc and Tppc in terms of Pc, with K
+    # valid data.  Return True if the trajectory ends here, having incropped
+    # or outcropped, in which case stp[c:] is filled with nan.
+
+    # Neighbouring casts' roots are usually close, so search for a sign
+    # change starting from a bracket about twice as wide as the trajectory's
+    # last step, but not much narrower than the cast.
+    if c > 1 and K > 1:
+        dp = 2.0 * max(abs(stp[c - 1, 2] - stp[c - 2, 2]), (Pc[K - 1] - Pc[0]) * 1e-3)
+    else:
+        dp = 0.0
+
+    stp[c, 0], stp[c, 1], stp[c, 2] = _ntp_bottle_to_cast(
+        stp[c - 1, 0],
+        stp[c - 1, 1],
+        stp[c - 1, 2],
+        Sppc,
+        Tppc,
+        Pc,
+        K,
+        tol_p,
+        eos_diff,
+        dp,
+        zero_fn,
+        tol_eos,
+    )
+
+    if np.isnan(stp[c, 2]):
+        # Remaining casts are not on the trajectory.
+        stp[c:] = np.nan
+        return True
+    return False
+
+
+def neutral_trajectories_batch(
+    S,
+    T,
+    P,
+    p0,
+    tol_p=1e-4,
+    interp="linear",
+    eos="gsw",
+    grav=None,
+    rho_c=None,
+    method="brent",
+    tol_eos=0.0,
+):
+    """Calculate many neutral trajectories through a sequence of casts.
+
+    As `neutral_trajectory`, but starting from each pressure / depth in `p0`
+    on the first cast.  The trajectories are independent, so they are
+    calculated in parallel.  The number of threads can be set by
+    `numba.set_num_threads`.
+
+    Parameters
+    ----------
+    S, T, P :
+        See neutral_trajectory
+
+    p0 : 1D ndarray
+
+        The pressures / depths at which to begin the neutral trajectories on
+        the first cast
+
+    Returns
+    -------
+    s, t, p : 2D ndarray
+
+        practical / Absolute Salinity, potential / Conservative Temperature,
+        and pressure / depth along the neutral trajectories.  The first
+        dimension specifies the trajectory, and the second the cast; e.g.
+        `p[i,:]` is the pressure / depth along the trajectory starting at
+        `p0[i]`.
+
+    Other Parameters
+    ----------------
+    tol_p, interp, eos, grav, rho_c, method, tol_eos :
+        See neutral_trajectory
+    """
+
+    eos_diff = make_eos_diff(eos, grav, rho_c)
+    ppc_fn = select_ppc(interp, "1")
+    zero_fn = select_zero(method)
+
+    S, T, P = (np.ascontiguousarray(x, dtype=_work_dtype(x)) for x in (S, T, P))
+    p0 = np.asarray(p0, dtype=np.float64).reshape(-1)
+
+    n_good = find_first_nan_2d(S)
+
+    return _neutral_trajectories_batch_core(
+        S, T, P, n_good, p0, tol_p, eos_diff, ppc_fn, zero_fn, tol_eos
+    )
+
+
+@nb.njit(parallel=True)
+def _neutral_trajectories_batch_core(
+    S, T, P, n_good, p0, tol_p, eos_diff, ppc_fn, zero_fn=brent, tol_eos=0.0
+):
+    """Calculate many neutral trajectories through a sequence of casts.
+
+    Fast version of `neutral_trajectories_batch`, with all inputs supplied.
+    See `_neutral_trajectory_core` for the inputs.
+    """
+    n = p0.size
+    nc, nk = S.shape
+
+    # The casts are the same for every trajectory, so build the interpolants
+    # for all casts once, in double precision, before starting.
+    Pd = np.asarray(P, dtype=np.float64)
+    ncoef = ppc_fn(Pd[0], np.asarray(S[0], dtype=np.float64)).shape[1]
+    Sppc = np.empty((nc, nk, ncoef))
+    Tppc = np.empty((nc, nk, ncoef))
+    for c in nb.prange(nc):
+        Sppc[c] = ppc_fn(Pd[c], np.asarray(S[c], dtype=np.float64))
+        Tppc[c] = ppc_fn(Pd[c], np.asarray(T[c], dtype=np.float64))
+
+    s = np.empty((n, nc))
+    t = np.empty((n, nc))
+    p = np.empty((n, nc))
+
+    # The casts are only read, so the trajectories are independent.
+    for i in nb.prange(n):
+        s[i], t[i], p[i] = _neutral_trajectory_ppc_core(
+            Sppc, Tppc, Pd, n_good, p0[i], tol_p, eos_diff, zero_fn, tol_eos
+        )
+
     return s, t, p